@@ -196,7 +196,8 @@ class BaseRouteHandler:
             layers.append(cur)
             cur = cur.owner
 
-        return list(reversed(layers))
+        layers.reverse()
+        return layers
 
     def resolve_type_encoders(self) -> TypeEncodersMap:
         """Return a merged type_encoders mapping.
@@ -316,12 +317,12 @@ class BaseRouteHandler:
             An optional :class:`DTO type <.dto.interface.DTOInterface>`
         """
         if self._resolved_dto is Empty:
-            dtos: list[type[DTOInterface] | None] = [
-                layer_dto  # type:ignore[misc]
-                for layer in self.ownership_layers
-                if (layer_dto := layer.dto) is not Empty
-            ]
-            self._resolved_dto = dtos[-1] if dtos else None
+            for layer in reversed(self.ownership_layers):
+                if (layer_dto := layer.dto) is not Empty:
+                    self._resolved_dto = layer_dto
+                    break
+            else:
+                self._resolved_dto = None
 
         return cast("type[DTOInterface] | None", self._resolved_dto)
 
@@ -334,12 +335,12 @@ class BaseRouteHandler:
             An optional :class:`DTO type <.dto.interface.DTOInterface>`
         """
         if self._resolved_return_dto is Empty:
-            return_dtos: list[type[DTOInterface] | None] = [
-                layer_dto_type  # type:ignore[misc]
-                for layer in self.ownership_layers
-                if (layer_dto_type := layer.return_dto) is not Empty
-            ]
-            self._resolved_return_dto = return_dtos[-1] if return_dtos else self.resolve_dto()
+            for layer in reversed(self.ownership_layers):
+                if (layer_dto_type := layer.return_dto) is not Empty:
+                    self._resolved_return_dto = layer_dto_type
+                    break
+            else:
+                self._resolved_return_dto = self.resolve_dto()
 
         return cast("type[DTOInterface] | None", self._resolved_return_dto)
 
@@ -70,7 +70,19 @@ def create_data_handler(
     cookie_headers = [cookie.to_encoded_header() for cookie in cookies if not cookie.documentation_only]
     raw_headers = [*normalized_headers, *cookie_headers]
 
-    async def create_response(data: Any) -> ASGIApp:
+    async def handler(
+        data: Any,
+        return_dto: type[DTOInterface] | None,
+        request: Request[Any, Any, Any],
+        **kwargs: Any,
+    ) -> ASGIApp:
+        if isawaitable(data):
+            data = await data
+
+        if return_dto:
+            ctx = ConnectionContext.from_connection(request)
+            data = return_dto(ctx).data_to_encodable_type(data)
+
         response = response_class(
             background=background,
             content=data,
@@ -79,28 +91,21 @@ def create_data_handler(
             type_encoders=type_encoders,
         )
         response.raw_headers = raw_headers
-
-        if after_request:
-            return await after_request(response)  # type: ignore
-
         return response
 
-    async def handler(
+    if after_request is None:
+        return handler
+
+    # the after request hook is known when the handler is created, so only handlers that have one pay for the extra call
+    async def handler_with_after_request(
         data: Any,
         return_dto: type[DTOInterface] | None,
         request: Request[Any, Any, Any],
         **kwargs: Any,
     ) -> ASGIApp:
-        if isawaitable(data):
-            data = await data
+        return await after_request(await handler(data=data, return_dto=return_dto, request=request))  # type: ignore
 
-        if return_dto:
-            ctx = ConnectionContext.from_connection(request)
-            data = return_dto(ctx).data_to_encodable_type(data)
-
-        return await create_response(data=data)
-
-    return handler
+    return handler_with_after_request
 
 
 def filter_cookies(local_cookies: frozenset[Cookie], layered_cookies: frozenset[Cookie]) -> list[Cookie]:
@@ -213,9 +218,12 @@ def create_response_handler(
     return handler
 
 
-def normalize_http_method(http_methods: HttpMethod | Method | Sequence[HttpMethod | Method]) -> set[Method]:
+@lru_cache(128)
+def normalize_http_method(http_methods: HttpMethod | Method | Sequence[HttpMethod | Method]) -> frozenset[Method]:
     """Normalize HTTP method(s) into a set of upper-case method names.
 
+    This function is memoized, so sequences of methods must be passed as a hashable type, e.g. a tuple.
+
     Args:
         http_methods: A value for http method.
 
@@ -233,10 +241,10 @@ def normalize_http_method(http_methods: HttpMethod | Method | Sequence[HttpMetho
             raise ValidationException(f"Invalid HTTP method: {method_name}")
         output.add(method_name)
 
-    return cast("set[Method]", output)
+    return cast("frozenset[Method]", frozenset(output))
 
 
-def get_default_status_code(http_methods: set[Method]) -> int:
+def get_default_status_code(http_methods: frozenset[Method]) -> int:
     """Return the default status code for a given set of HTTP methods.
 
     Args:
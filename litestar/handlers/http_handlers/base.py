@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-from enum import Enum
-from typing import TYPE_CHECKING, AnyStr, Mapping, TypedDict, cast
+from typing import TYPE_CHECKING, AnyStr, Mapping, cast
 
 from litestar._layers.utils import narrow_response_cookies, narrow_response_headers
 from litestar.datastructures.cookie import Cookie
@@ -44,12 +43,12 @@ from litestar.types import (
     TypeEncodersMap,
 )
 from litestar.types.builtin_types import NoneType
-from litestar.utils import AsyncCallable, async_partial
+from litestar.utils import AsyncCallable, async_partial, get_enum_string_value
 from litestar.utils.predicates import is_async_callable
 from litestar.utils.warnings import warn_implicit_sync_to_thread, warn_sync_to_thread_with_async_callable
 
 if TYPE_CHECKING:
-    from typing import Any, Awaitable, Callable, Sequence
+    from typing import Any, Awaitable, Callable, Iterable, Sequence
 
     from litestar.app import Litestar
     from litestar.background_tasks import BackgroundTask, BackgroundTasks
@@ -65,10 +64,8 @@ if TYPE_CHECKING:
 
 __all__ = ("HTTPRouteHandler", "route")
 
-
-class ResponseHandlerMap(TypedDict):
-    default_handler: Callable[[Any], Awaitable[ASGIApp]] | EmptyType
-    response_type_handler: Callable[[Any], Awaitable[ASGIApp]] | EmptyType
+_EMPTY_COOKIES: frozenset[Cookie] = frozenset()
+_EMPTY_HEADERS: frozenset[ResponseHeader] = frozenset()
 
 
 class HTTPRouteHandler(BaseRouteHandler):
@@ -78,9 +75,14 @@ class HTTPRouteHandler(BaseRouteHandler):
     """
 
     __slots__ = (
+        "_default_handler",
+        "_resolved_after_request",
         "_resolved_after_response",
         "_resolved_before_request",
-        "_response_handler_mapping",
+        "_resolved_response_class",
+        "_resolved_response_cookies",
+        "_resolved_response_headers",
+        "_response_type_handler",
         "after_request",
         "after_response",
         "background",
@@ -232,7 +234,9 @@ class HTTPRouteHandler(BaseRouteHandler):
         if not http_method:
             raise ImproperlyConfiguredException("An http_method kwarg is required")
 
-        self.http_methods = normalize_http_method(http_methods=http_method)
+        self.http_methods = normalize_http_method(
+            http_methods=http_method if isinstance(http_method, str) else tuple(http_method)
+        )
         self.status_code = status_code or get_default_status_code(http_methods=self.http_methods)
 
         super().__init__(
@@ -279,13 +283,19 @@ class HTTPRouteHandler(BaseRouteHandler):
         self.security = security
         self.responses = responses
         # memoized attributes, defaulted to Empty
+        self._resolved_after_request: AsyncCallable | None | EmptyType = Empty
         self._resolved_after_response: AsyncCallable | None | EmptyType = Empty
         self._resolved_before_request: AsyncCallable | None | EmptyType = Empty
-        self._response_handler_mapping: ResponseHandlerMap = {"default_handler": Empty, "response_type_handler": Empty}
+        self._resolved_response_class: type[Response] | EmptyType = Empty
+        self._resolved_response_cookies: frozenset[Cookie] | EmptyType = Empty
+        self._resolved_response_headers: frozenset[ResponseHeader] | EmptyType = Empty
+        self._default_handler: Callable[[Any], Awaitable[ASGIApp]] | EmptyType = Empty
+        self._response_type_handler: Callable[[Any], Awaitable[ASGIApp]] | EmptyType = Empty
 
     def __call__(self, fn: AnyCallable) -> HTTPRouteHandler:
         """Replace a function with itself."""
-        if not is_async_callable(fn):
+        self.has_sync_callable = not is_async_callable(fn)
+        if self.has_sync_callable:
             if self.sync_to_thread is None:
                 warn_implicit_sync_to_thread(fn, stacklevel=3)
         elif self.sync_to_thread is not None:
@@ -302,58 +312,45 @@ class HTTPRouteHandler(BaseRouteHandler):
         Returns:
             The default :class:`Response <.response.Response>` class for the route handler.
         """
-        for layer in list(reversed(self.ownership_layers)):
-            if layer.response_class is not None:
-                return layer.response_class
-        return Response
+        if self._resolved_response_class is Empty:
+            self._resolve_layered_attributes()
+        return cast("type[Response]", self._resolved_response_class)
 
     def resolve_response_headers(self) -> frozenset[ResponseHeader]:
         """Return all header parameters in the scope of the handler function.
 
+        This method is memoized so the computation occurs only once.
+
         Returns:
             A dictionary mapping keys to :class:`ResponseHeader <.datastructures.ResponseHeader>` instances.
         """
-        resolved_response_headers: dict[str, ResponseHeader] = {}
-
-        for layer in self.ownership_layers:
-            if layer_response_headers := layer.response_headers:
-                if isinstance(layer_response_headers, Mapping):
-                    # this can't happen unless you manually set response_headers on an instance, which would result in a
-                    # type-checking error on everything but the controller. We cover this case nevertheless
-                    resolved_response_headers.update(
-                        {name: ResponseHeader(name=name, value=value) for name, value in layer_response_headers.items()}
-                    )
-                else:
-                    resolved_response_headers.update({h.name: h for h in layer_response_headers})
-            for extra_header in ("cache_control", "etag"):
-                header_model: Header | None = getattr(layer, extra_header, None)
-                if header_model:
-                    resolved_response_headers[header_model.HEADER_NAME] = ResponseHeader(
-                        name=header_model.HEADER_NAME,
-                        value=header_model.to_header(),
-                        documentation_only=header_model.documentation_only,
-                    )
-
-        return frozenset(resolved_response_headers.values())
+        if self._resolved_response_headers is Empty:
+            self._resolve_layered_attributes()
+        return cast("frozenset[ResponseHeader]", self._resolved_response_headers)
 
     def resolve_response_cookies(self) -> frozenset[Cookie]:
         """Return a list of Cookie instances. Filters the list to ensure each cookie key is unique.
 
+        This method is memoized so the computation occurs only once.
+
         Returns:
             A list of :class:`Cookie <.datastructures.Cookie>` instances.
         """
-        response_cookies: set[Cookie] = set()
-        for layer in reversed(self.ownership_layers):
-            if layer_response_cookies := layer.response_cookies:
-                if isinstance(layer_response_cookies, Mapping):
-                    # this can't happen unless you manually set response_cookies on an instance, which would result in a
-                    # type-checking error on everything but the controller. We cover this case nevertheless
-                    response_cookies.update(
-                        {Cookie(key=key, value=value) for key, value in layer_response_cookies.items()}
-                    )
-                else:
-                    response_cookies.update(cast("set[Cookie]", layer_response_cookies))
-        return frozenset(response_cookies)
+        if self._resolved_response_cookies is Empty:
+            self._resolve_layered_attributes()
+        return cast("frozenset[Cookie]", self._resolved_response_cookies)
+
+    def resolve_type_encoders(self) -> TypeEncodersMap:
+        """Return a merged type_encoders mapping.
+
+        This method is memoized so the computation occurs only once.
+
+        Returns:
+            A dict of type encoders
+        """
+        if self._resolved_type_encoders is Empty:
+            self._resolve_layered_attributes()
+        return cast("TypeEncodersMap", self._resolved_type_encoders)
 
     def resolve_before_request(self) -> AsyncCallable | None:
         """Resolve the before_handler handler by starting from the route handler and moving up.
@@ -365,11 +362,21 @@ class HTTPRouteHandler(BaseRouteHandler):
             An optional :class:`before request lifecycle hook handler <.types.BeforeRequestHookHandler>`
         """
         if self._resolved_before_request is Empty:
-            before_request_handlers: list[AsyncCallable] = [
-                layer.before_request for layer in self.ownership_layers if layer.before_request  # type: ignore[misc]
-            ]
-            self._resolved_before_request = before_request_handlers[-1] if before_request_handlers else None
-        return cast("AsyncCallable | None", self._resolved_before_request)
+            self._resolve_layered_attributes()
+        return self._resolved_before_request  # type: ignore[return-value]
+
+    def resolve_after_request(self) -> AsyncCallable | None:
+        """Resolve the after_request handler by starting from the route handler and moving up.
+
+        If a handler is found it is returned, otherwise None is set.
+        This method is memoized so the computation occurs only once.
+
+        Returns:
+            An optional :class:`after request lifecycle hook handler <.types.AfterRequestHookHandler>`
+        """
+        if self._resolved_after_request is Empty:
+            self._resolve_layered_attributes()
+        return self._resolved_after_request  # type: ignore[return-value]
 
     def resolve_after_response(self) -> AsyncCallable | None:
         """Resolve the after_response handler by starting from the route handler and moving up.
@@ -381,12 +388,82 @@ class HTTPRouteHandler(BaseRouteHandler):
             An optional :class:`after response lifecycle hook handler <.types.AfterResponseHookHandler>`
         """
         if self._resolved_after_response is Empty:
-            after_response_handlers: list[AsyncCallable] = [
-                layer.after_response for layer in self.ownership_layers if layer.after_response  # type: ignore[misc]
-            ]
-            self._resolved_after_response = after_response_handlers[-1] if after_response_handlers else None
+            self._resolve_layered_attributes()
+        return self._resolved_after_response  # type: ignore[return-value]
+
+    def _resolve_layered_attributes(self) -> None:  # noqa: C901
+        """Resolve the layered lifecycle hooks and response attributes in a single pass over the ownership layers.
+
+        Layers are traversed from the app down to the route handler, so values declared closer to the handler take
+        precedence. Attributes that have already been resolved are left untouched.
+        """
+        after_request: AsyncCallable | None = None
+        after_response: AsyncCallable | None = None
+        before_request: AsyncCallable | None = None
+        response_class: type[Response] = Response
+        response_cookies: dict[Cookie, Cookie] = {}
+        response_headers: dict[str, ResponseHeader] = {}
+        type_encoders: dict[Any, Callable[[Any], Any]] = {}
+
+        for layer in self.ownership_layers:
+            after_request = layer.after_request or after_request  # type: ignore[assignment]
+            after_response = layer.after_response or after_response  # type: ignore[assignment]
+            before_request = layer.before_request or before_request  # type: ignore[assignment]
+
+            if layer.response_class is not None:
+                response_class = layer.response_class
+
+            if layer_type_encoders := getattr(layer, "type_encoders", None):
+                type_encoders.update(layer_type_encoders)
+
+            if layer_response_headers := layer.response_headers:
+                if isinstance(layer_response_headers, Mapping):
+                    # this can't happen unless you manually set response_headers on an instance, which would result in a
+                    # type-checking error on everything but the controller. We cover this case nevertheless
+                    response_headers.update(
+                        {name: ResponseHeader(name=name, value=value) for name, value in layer_response_headers.items()}
+                    )
+                else:
+                    response_headers.update({h.name: h for h in layer_response_headers})
+            for extra_header in ("cache_control", "etag"):
+                header_model: Header | None = getattr(layer, extra_header, None)
+                if header_model:
+                    response_headers[header_model.HEADER_NAME] = ResponseHeader(
+                        name=header_model.HEADER_NAME,
+                        value=header_model.to_header(),
+                        documentation_only=header_model.documentation_only,
+                    )
+
+            if layer_response_cookies := layer.response_cookies:
+                cookies: Iterable[Cookie]
+                if isinstance(layer_response_cookies, Mapping):
+                    # this can't happen unless you manually set response_cookies on an instance, which would result in a
+                    # type-checking error on everything but the controller. We cover this case nevertheless
+                    cookies = (Cookie(key=key, value=value) for key, value in layer_response_cookies.items())
+                else:
+                    cookies = layer_response_cookies
+                # cookies are unique by key, path and domain, so a cookie from a lower layer replaces an equal one
+                for cookie in cookies:
+                    response_cookies[cookie] = cookie
 
-        return cast("AsyncCallable | None", self._resolved_after_response)
+        if self._resolved_after_request is Empty:
+            self._resolved_after_request = after_request
+        if self._resolved_after_response is Empty:
+            self._resolved_after_response = after_response
+        if self._resolved_before_request is Empty:
+            self._resolved_before_request = before_request
+        if self._resolved_response_class is Empty:
+            self._resolved_response_class = response_class
+        if self._resolved_response_cookies is Empty:
+            self._resolved_response_cookies = (
+                frozenset(response_cookies.values()) if response_cookies else _EMPTY_COOKIES
+            )
+        if self._resolved_response_headers is Empty:
+            self._resolved_response_headers = (
+                frozenset(response_headers.values()) if response_headers else _EMPTY_HEADERS
+            )
+        if self._resolved_type_encoders is Empty:
+            self._resolved_type_encoders = type_encoders
 
     def get_response_handler(self, is_response_type_data: bool = False) -> Callable[[Any], Awaitable[ASGIApp]]:
         """Resolve the response_handler function for the route handler.
@@ -399,16 +476,8 @@ class HTTPRouteHandler(BaseRouteHandler):
         Returns:
             Async Callable to handle an HTTP Request
         """
-        if self._response_handler_mapping["default_handler"] is Empty:
-            after_request_handlers: list[AsyncCallable] = [
-                layer.after_request for layer in self.ownership_layers if layer.after_request  # type: ignore[misc]
-            ]
-            after_request = cast(
-                "AfterRequestHookHandler | None",
-                after_request_handlers[-1] if after_request_handlers else None,
-            )
-
-            media_type = self.media_type.value if isinstance(self.media_type, Enum) else self.media_type
+        if self._default_handler is Empty:
+            after_request = cast("AfterRequestHookHandler | None", self.resolve_after_request())
             response_class = self.resolve_response_class()
             headers = self.resolve_response_headers()
             cookies = self.resolve_response_cookies()
@@ -421,42 +490,38 @@ class HTTPRouteHandler(BaseRouteHandler):
                 handler_return_type = before_request_handler.parsed_signature.return_type
                 if not handler_return_type.is_subclass_of((Empty, NoneType)):
                     return_annotation = handler_return_type.annotation
-            self._response_handler_mapping["response_type_handler"] = response_type_handler = create_response_handler(
+            self._response_type_handler = response_type_handler = create_response_handler(
                 cookies=cookies, after_request=after_request
             )
 
             if return_type.is_subclass_of(Response):
-                self._response_handler_mapping["default_handler"] = response_type_handler
+                self._default_handler = response_type_handler
             elif return_type.is_subclass_of(ResponseContainer):
-                self._response_handler_mapping["default_handler"] = create_response_container_handler(
+                self._default_handler = create_response_container_handler(
                     after_request=after_request,
                     cookies=cookies,
                     headers=headers,
-                    media_type=media_type,
+                    media_type=self.media_type,
                     status_code=self.status_code,
                 )
             elif is_async_callable(return_annotation) or return_annotation is ASGIApp:
-                self._response_handler_mapping["default_handler"] = create_generic_asgi_response_handler(
+                self._default_handler = create_generic_asgi_response_handler(
                     cookies=cookies, after_request=after_request
                 )
             else:
-                self._response_handler_mapping["default_handler"] = create_data_handler(
+                self._default_handler = create_data_handler(
                     after_request=after_request,
                     background=self.background,
                     cookies=cookies,
                     headers=headers,
-                    media_type=media_type,
+                    media_type=self.media_type,
                     response_class=response_class,
                     status_code=self.status_code,
                     type_encoders=type_encoders,
                 )
 
-        return cast(
-            "Callable[[Any], Awaitable[ASGIApp]]",
-            self._response_handler_mapping["response_type_handler"]
-            if is_response_type_data
-            else self._response_handler_mapping["default_handler"],
-        )
+        # both handlers are always resolved together
+        return self._response_type_handler if is_response_type_data else self._default_handler  # type: ignore[return-value]
 
     async def to_response(self, app: Litestar, data: Any, request: Request) -> ASGIApp:
         """Return a :class:`Response <.response.Response>` from the handler by resolving and calling it.
@@ -470,7 +535,11 @@ class HTTPRouteHandler(BaseRouteHandler):
         Returns:
             A Response instance
         """
-        response_handler = self.get_response_handler(is_response_type_data=isinstance(data, Response))
+        is_response_type_data = type(data) is Response or isinstance(data, Response)
+        response_handler = self._response_type_handler if is_response_type_data else self._default_handler
+        if response_handler is Empty:
+            # the handler has not been registered on an app, so the response handlers were not resolved yet
+            response_handler = self.get_response_handler(is_response_type_data=is_response_type_data)
         return await response_handler(app=app, data=data, request=request, return_dto=self.resolve_return_dto())  # type: ignore
 
     def on_registration(self, app: Litestar) -> None:
@@ -478,6 +547,8 @@ class HTTPRouteHandler(BaseRouteHandler):
         if before_request := self.resolve_before_request():
             before_request.set_parsed_signature(self.resolve_signature_namespace())
         self.resolve_after_response()
+        self.resolve_return_dto()
+        self.get_response_handler()
 
     def _validate_handler_function(self) -> None:
         """Validate the route handler function once it is set by inspecting its return annotations."""
@@ -507,6 +578,9 @@ class HTTPRouteHandler(BaseRouteHandler):
             else:
                 self.media_type = MediaType.JSON
 
+        # normalize once so that the response handlers receive a plain string
+        self.media_type = get_enum_string_value(self.media_type)
+
         if "socket" in self.parsed_fn_signature.parameters:
             raise ImproperlyConfiguredException("The 'socket' kwarg is not supported with http handlers")
 
@@ -516,12 +590,12 @@ class HTTPRouteHandler(BaseRouteHandler):
     def _set_runtime_callables(self) -> None:
         """Set the runtime callables for the route handler."""
         super()._set_runtime_callables()
-        self.has_sync_callable = False
-        if not is_async_callable(self.fn.value):
-            if self.sync_to_thread:
+        # 'has_sync_callable' is determined when the function is decorated. The function reference is shared between
+        # copies of the handler, so it might have been wrapped already by a previous registration.
+        if self.has_sync_callable and self.sync_to_thread:
+            if not is_async_callable(self.fn.value):
                 self.fn.value = async_partial(self.fn.value)
-            else:
-                self.has_sync_callable = True
+            self.has_sync_callable = False
 
 
 route = HTTPRouteHandler
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from litestar.enums import HttpMethod, MediaType
+from litestar.enums import HttpMethod
 from litestar.exceptions import HTTPException, ImproperlyConfiguredException
 from litestar.openapi.spec import Operation
 from litestar.response import FileResponse
@@ -20,6 +20,7 @@ if TYPE_CHECKING:
     from litestar.config.response_cache import CACHE_FOREVER
     from litestar.datastructures import CacheControlHeader, ETag
     from litestar.dto.interface import DTOInterface
+    from litestar.enums import MediaType
     from litestar.openapi.datastructures import ResponseSpec
     from litestar.openapi.spec import SecurityRequirement
     from litestar.types import (
@@ -50,6 +51,8 @@ class delete(HTTPRouteHandler):
     Use this decorator to decorate an HTTP handler for DELETE requests.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         path: str | None | list[str] | None = None,
@@ -214,6 +217,8 @@ class get(HTTPRouteHandler):
     Use this decorator to decorate an HTTP handler for GET requests.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         path: str | None | list[str] | None = None,
@@ -379,6 +384,8 @@ class head(HTTPRouteHandler):
     Use this decorator to decorate an HTTP handler for HEAD requests.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         path: str | None | list[str] | None = None,
@@ -548,7 +555,7 @@ class head(HTTPRouteHandler):
         # we allow here File and FileResponse because these have special setting for head responses
         return_annotation = self.parsed_fn_signature.return_type.annotation
         if not (
-            return_annotation in {NoneType, None}
+            return_annotation in {NoneType, None, File, FileResponse}
             or is_class_and_subclass(return_annotation, File)
             or is_class_and_subclass(return_annotation, FileResponse)
         ):
@@ -561,6 +568,8 @@ class patch(HTTPRouteHandler):
     Use this decorator to decorate an HTTP handler for PATCH requests.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         path: str | None | list[str] | None = None,
@@ -725,6 +734,8 @@ class post(HTTPRouteHandler):
     Use this decorator to decorate an HTTP handler for POST requests.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         path: str | None | list[str] | None = None,
@@ -889,6 +900,8 @@ class put(HTTPRouteHandler):
     Use this decorator to decorate an HTTP handler for PUT requests.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         path: str | None | list[str] | None = None,
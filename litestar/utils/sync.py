@@ -37,7 +37,7 @@ T = TypeVar("T")
 class AsyncCallable(Generic[P, T]):
     """Wrap a callable into an asynchronous callable."""
 
-    __slots__ = ("args", "kwargs", "ref", "is_method", "num_expected_args", "_parsed_signature")
+    __slots__ = ("args", "kwargs", "ref", "_fn", "_num_expected_args", "_parsed_signature")
 
     def __init__(self, fn: Callable[P, T]) -> None:
         """Initialize the wrapper from any callable.
@@ -45,9 +45,9 @@ class AsyncCallable(Generic[P, T]):
         Args:
             fn: Callable to wrap - can be any sync or async callable.
         """
+        self._fn = fn
+        self._num_expected_args: int | EmptyType = Empty
         self._parsed_signature: ParsedSignature | EmptyType = Empty
-        self.is_method = ismethod(fn) or (callable(fn) and ismethod(fn.__call__))  # type: ignore
-        self.num_expected_args = len(getfullargspec(fn).args) - (1 if self.is_method else 0)
         self.ref = Ref[Callable[..., Awaitable[T]]](
             fn if is_async_callable(fn) else async_partial(fn)  # pyright: ignore
         )
@@ -64,6 +64,22 @@ class AsyncCallable(Generic[P, T]):
         """
         return await self.ref.value(*args, **kwargs)
 
+    @property
+    def is_method(self) -> bool:
+        """Whether the wrapped callable is a bound method or an instance with a bound ``__call__`` method."""
+        return ismethod(self._fn) or (callable(self._fn) and ismethod(self._fn.__call__))  # type: ignore
+
+    @property
+    def num_expected_args(self) -> int:
+        """Return the number of positional arguments expected by the wrapped callable.
+
+        This property is memoized and only computed on first access, since inspecting the callable is comparatively
+        expensive.
+        """
+        if self._num_expected_args is Empty:
+            self._num_expected_args = len(getfullargspec(self._fn).args) - (1 if self.is_method else 0)
+        return cast("int", self._num_expected_args)
+
     @property
     def parsed_signature(self) -> ParsedSignature:
         if self._parsed_signature is Empty:
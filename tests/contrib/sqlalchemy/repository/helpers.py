@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import inspect
 import sys
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from typing import Any, Awaitable, TypeVar, cast, overload
 
 import pytest
@@ -28,16 +28,12 @@ async def maybe_async(obj: Awaitable[T] | T) -> T:
 
 def update_raw_records(raw_authors: list[dict[str, Any]], raw_rules: list[dict[str, Any]]) -> None:
     for raw_author in raw_authors:
-        raw_author["dob"] = datetime.strptime(raw_author["dob"], "%Y-%m-%d").date()
-        raw_author["created_at"] = datetime.strptime(raw_author["created_at"], "%Y-%m-%dT%H:%M:%S").astimezone(
-            timezone.utc
-        )
-        raw_author["updated_at"] = datetime.strptime(raw_author["updated_at"], "%Y-%m-%dT%H:%M:%S").astimezone(
-            timezone.utc
-        )
+        raw_author["dob"] = date.fromisoformat(raw_author["dob"])
+        raw_author["created_at"] = datetime.fromisoformat(raw_author["created_at"]).replace(tzinfo=timezone.utc)
+        raw_author["updated_at"] = datetime.fromisoformat(raw_author["updated_at"]).replace(tzinfo=timezone.utc)
     for raw_rule in raw_rules:
-        raw_rule["created_at"] = datetime.strptime(raw_rule["created_at"], "%Y-%m-%dT%H:%M:%S").astimezone(timezone.utc)
-        raw_rule["updated_at"] = datetime.strptime(raw_rule["updated_at"], "%Y-%m-%dT%H:%M:%S").astimezone(timezone.utc)
+        raw_rule["created_at"] = datetime.fromisoformat(raw_rule["created_at"]).replace(tzinfo=timezone.utc)
+        raw_rule["updated_at"] = datetime.fromisoformat(raw_rule["updated_at"]).replace(tzinfo=timezone.utc)
 
 
 mark_requires_docker = [
@@ -18,6 +18,16 @@ def test_sync_to_thread(sync_to_thread: bool) -> None:
         assert response.text == "Hello World"
 
 
+@pytest.mark.parametrize("sync_to_thread", [True, False])
+def test_sync_to_thread_handler_registered_multiple_times(sync_to_thread: bool) -> None:
+    handler = get("/", media_type=MediaType.TEXT, sync_to_thread=sync_to_thread)(sync_handler)
+
+    for _ in range(2):
+        with create_test_client(handler) as client:
+            response = client.get("/")
+            assert response.text == "Hello World"
+
+
 @pytest.mark.usefixtures("enable_warn_implicit_sync_to_thread")
 def test_sync_to_thread_not_set_warns() -> None:
     with pytest.warns(LitestarWarning, match="discouraged since synchronous callables"):
@@ -159,8 +159,8 @@ def test_create_success_response_with_headers() -> None:
     assert response.description == "test"
 
     assert response.content
-    assert isinstance(handler.media_type, MediaType)
-    schema = response.content[handler.media_type.value].schema
+    assert handler.media_type == MediaType.JSON
+    schema = response.content[handler.media_type].schema
     assert isinstance(schema, Schema)
     assert schema.content_encoding == "base64"
     assert schema.content_media_type == "image/png"